@@ -306,6 +306,39 @@ class Groups(list):  # no need to inherit from slotted object
 _EQUALITY_SENTINEL_SELF = object()
 _EQUALITY_SENTINEL_OTHER = object()
 
+# groupings of ElementSearch values used by Music21Object.getContextByClass
+_OFFSET_METHODS = (
+    ElementSearch.BEFORE_OFFSET,
+    ElementSearch.AFTER_OFFSET,
+    ElementSearch.AT_OR_BEFORE_OFFSET,
+    ElementSearch.AT_OR_AFTER_OFFSET,
+)
+_BEFORE_METHODS = (
+    ElementSearch.BEFORE,
+    ElementSearch.BEFORE_OFFSET,
+    ElementSearch.AT_OR_BEFORE,
+    ElementSearch.AT_OR_BEFORE_OFFSET,
+    ElementSearch.BEFORE_NOT_SELF,
+)
+_AFTER_METHODS = (
+    ElementSearch.AFTER,
+    ElementSearch.AFTER_OFFSET,
+    ElementSearch.AT_OR_AFTER,
+    ElementSearch.AT_OR_AFTER,
+    ElementSearch.AT_OR_AFTER_OFFSET,
+    ElementSearch.AFTER_NOT_SELF,
+)
+_AT_METHODS = (
+    ElementSearch.AT_OR_BEFORE,
+    ElementSearch.AT_OR_AFTER,
+    ElementSearch.AT_OR_BEFORE_OFFSET,
+    ElementSearch.AT_OR_AFTER_OFFSET,
+)
+_NOT_SELF_METHODS = (
+    ElementSearch.BEFORE_NOT_SELF,
+    ElementSearch.AFTER_NOT_SELF,
+)
+
 
 @functools.cache
 def _getEqualityAttributes(cls) -> frozenset[str]:
@@ -1587,37 +1620,6 @@ class Music21Object(prebase.ProtoM21Object):
         <music21.stream.Measure 3 offset=5.0> SortTuple(atEnd=0, offset=1.0, ...) elementsFirst
         <music21.stream.Part 0x1118cadd8> SortTuple(atEnd=0, offset=6.0, ...) flatten
         '''
-        OFFSET_METHODS = [
-            ElementSearch.BEFORE_OFFSET,
-            ElementSearch.AFTER_OFFSET,
-            ElementSearch.AT_OR_BEFORE_OFFSET,
-            ElementSearch.AT_OR_AFTER_OFFSET,
-        ]
-        BEFORE_METHODS = [
-            ElementSearch.BEFORE,
-            ElementSearch.BEFORE_OFFSET,
-            ElementSearch.AT_OR_BEFORE,
-            ElementSearch.AT_OR_BEFORE_OFFSET,
-            ElementSearch.BEFORE_NOT_SELF,
-        ]
-        AFTER_METHODS = [
-            ElementSearch.AFTER,
-            ElementSearch.AFTER_OFFSET,
-            ElementSearch.AT_OR_AFTER,
-            ElementSearch.AT_OR_AFTER,
-            ElementSearch.AT_OR_AFTER_OFFSET,
-            ElementSearch.AFTER_NOT_SELF,
-        ]
-        AT_METHODS = [
-            ElementSearch.AT_OR_BEFORE,
-            ElementSearch.AT_OR_AFTER,
-            ElementSearch.AT_OR_BEFORE_OFFSET,
-            ElementSearch.AT_OR_AFTER_OFFSET,
-        ]
-        NOT_SELF_METHODS = [
-            ElementSearch.BEFORE_NOT_SELF,
-            ElementSearch.AFTER_NOT_SELF,
-        ]
         # ALL is just a no-op
         def payloadExtractor(checkSite, flatten, innerPositionStart):
             '''
@@ -1629,7 +1631,7 @@ class Music21Object(prebase.ProtoM21Object):
             '''
             classList = None if not className else (className,)
             siteTree = checkSite.asTree(flatten=flatten, classList=classList)
-            if getElementMethod in OFFSET_METHODS:
+            if getElementMethod in _OFFSET_METHODS:
                 # these methods match only by offset.  Used in .getBeat among other places
                 if getElementMethod in (ElementSearch.BEFORE_OFFSET,
                                         ElementSearch.AT_OR_AFTER_OFFSET):
@@ -1637,7 +1639,7 @@ class Music21Object(prebase.ProtoM21Object):
                 else:
                     innerPositionStart = ZeroSortTupleHigh.modify(offset=innerPositionStart.offset)
 
-            if getElementMethod in BEFORE_METHODS:
+            if getElementMethod in _BEFORE_METHODS:
                 contextNode = siteTree.getNodeBefore(innerPositionStart)
             else:
                 contextNode = siteTree.getNodeAfter(innerPositionStart)
@@ -1743,11 +1745,11 @@ class Music21Object(prebase.ProtoM21Object):
                 # when crossing measure borders.  Thus, it's well-formed.
                 return True
 
-            if getElementMethod in BEFORE_METHODS and selfSortTuple < contextSortTuple:
+            if getElementMethod in _BEFORE_METHODS and selfSortTuple < contextSortTuple:
                 # print(getElementMethod, selfSortTuple.shortRepr(),
                 #       contextSortTuple.shortRepr(), self, contextEl)
                 return False
-            elif getElementMethod in AFTER_METHODS and selfSortTuple > contextSortTuple:
+            elif getElementMethod in _AFTER_METHODS and selfSortTuple > contextSortTuple:
                 # print(getElementMethod, selfSortTuple.shortRepr(),
                 #       contextSortTuple.shortRepr(), self, contextEl)
                 return False
@@ -1760,7 +1762,7 @@ class Music21Object(prebase.ProtoM21Object):
         if priorityTargetOnly and followDerivation:
             raise ValueError('priorityTargetOnly and followDerivation cannot both be True')
 
-        if getElementMethod in AT_METHODS and className in self.classSet:
+        if getElementMethod in _AT_METHODS and className in self.classSet:
             return self
 
         for site, positionStart, searchType in self.contextSites(
@@ -1783,12 +1785,12 @@ class Music21Object(prebase.ProtoM21Object):
                 # otherwise, continue to check for flattening
 
             if searchType != 'elementsOnly':  # flatten or elementsFirst
-                if (getElementMethod in AFTER_METHODS
+                if (getElementMethod in _AFTER_METHODS
                         and (not className
                              or className in site.classSet)):
-                    if getElementMethod in NOT_SELF_METHODS and self is site:
+                    if getElementMethod in _NOT_SELF_METHODS and self is site:
                         pass
-                    elif getElementMethod not in NOT_SELF_METHODS:  # for 'After' we can't do the
+                    elif getElementMethod not in _NOT_SELF_METHODS:  # for 'After' we can't do the
                         # containing site because that comes before.
                         return site  # if the site itself is the context, return it
 
@@ -1802,10 +1804,10 @@ class Music21Object(prebase.ProtoM21Object):
                         pass
                     return contextEl
 
-                if (getElementMethod in BEFORE_METHODS
+                if (getElementMethod in _BEFORE_METHODS
                         and (not className
                              or className in site.classSet)):
-                    if getElementMethod in NOT_SELF_METHODS and self is site:
+                    if getElementMethod in _NOT_SELF_METHODS and self is site:
                         pass
                     else:
                         return site  # if the site itself is the context, return it
@@ -2061,8 +2063,8 @@ class Music21Object(prebase.ProtoM21Object):
             if self.isStream and self not in memo:
                 streamSelf = t.cast('music21.stream.Stream', self)
                 recursionType = streamSelf.recursionType  # pylint: disable=no-member
-                environLocal.printDebug(
-                    f'Caller first is {callerFirst} with offsetAppend {offsetAppend}')
+                # environLocal.printDebug(
+                #     f'Caller first is {callerFirst} with offsetAppend {offsetAppend}')
                 if returnSortTuples:
                     selfSortTuple = streamSelf.sortTuple().modify(
                         offset=0.0,
@@ -2109,9 +2111,9 @@ class Music21Object(prebase.ProtoM21Object):
                 yield ContextTuple(siteObj, positionInStream.offset, recursionType)
 
             memo.add(siteObj)
-            environLocal.printDebug(
-                f'looking in contextSites for {siteObj}'
-                + f' with position {positionInStream.shortRepr()}')
+            # environLocal.printDebug(
+            #     f'looking in contextSites for {siteObj}'
+            #     + f' with position {positionInStream.shortRepr()}')
             for topLevel, inStreamPos, recurType in siteObj.contextSites(
                 callerFirst=callerFirst,
                 memo=memo,
@@ -2142,9 +2144,9 @@ class Music21Object(prebase.ProtoM21Object):
 
         if followDerivation:
             for derivedObject in topLevel.derivation.chain():
-                environLocal.printDebug(
-                    'looking now in derivedObject, '
-                    + f'{derivedObject} with offsetAppend {offsetAppend}')
+                # environLocal.printDebug(
+                #     'looking now in derivedObject, '
+                #     + f'{derivedObject} with offsetAppend {offsetAppend}')
                 for derivedCsTuple in derivedObject.contextSites(
                         callerFirst=None,
                         memo=memo,
@@ -2155,9 +2157,9 @@ class Music21Object(prebase.ProtoM21Object):
                     if derivedCsTuple.site in memo:
                         continue
 
-                    environLocal.printDebug(
-                        f'Yielding {derivedCsTuple} from derivedObject contextSites'
-                    )
+                    # environLocal.printDebug(
+                    #     f'Yielding {derivedCsTuple} from derivedObject contextSites'
+                    # )
                     offsetAdjustedCsTuple = ContextSortTuple(
                         derivedCsTuple.site,
                         derivedCsTuple.offset.modify(offset=derivedCsTuple[1].offset
@@ -2171,7 +2173,7 @@ class Music21Object(prebase.ProtoM21Object):
                                            offsetAdjustedCsTuple.recurseType)
                     memo.add(derivedCsTuple.site)
 
-        environLocal.printDebug('--returning from derivedObject search')
+        # environLocal.printDebug('--returning from derivedObject search')
 
     def getAllContextsByClass(self, className):
         '''
@@ -2597,7 +2599,9 @@ class Music21Object(prebase.ProtoM21Object):
         #                           self.id, 'id(self)', id(self), self.__class__])
         activeSiteWeakRef = self._activeSite
         if activeSiteWeakRef is not None:
-            activeSite = self.activeSite
+            # unwrap directly rather than through the .activeSite property,
+            # which would check self._activeSite again.
+            activeSite = common.unwrapWeakref(activeSiteWeakRef)
             if activeSite is None:
                 # it has died since last visit, as is the case with short-lived streams like
                 # .getElementsByClass, so we will return the most recent position
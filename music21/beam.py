@@ -74,9 +74,11 @@ To get rid of beams on a note do:
 from __future__ import annotations
 
 from collections.abc import Iterable
+import copy
 import typing as t
 import unittest
 
+from music21 import common
 from music21 import exceptions21
 from music21 import duration
 from music21 import environment
@@ -229,6 +231,41 @@ class Beams(prebase.ProtoM21Object, EqualSlottedObjectMixin):
 
     # SPECIAL METHODS #
 
+    def __deepcopy__(self, memo=None):
+        '''
+        Copy the container directly rather than through the generic
+        reduce-and-reconstruct path; most notes carry an empty Beams, and every
+        deepcopy of a note copies one.  The Beam objects themselves are still
+        deepcopied.
+
+        >>> import copy
+        >>> b = beam.Beams()
+        >>> b.fill('16th', type='start')
+        >>> c = copy.deepcopy(b)
+        >>> c
+        <music21.beam.Beams <music21.beam.Beam 1/start>/<music21.beam.Beam 2/start>>
+        >>> c.beamsList[0] is b.beamsList[0]
+        False
+        >>> copy.deepcopy(beam.Beams()).beamsList
+        []
+
+        Subclasses may add attributes of their own, so they are copied in full:
+
+        >>> class FancyBeams(beam.Beams):
+        ...     pass
+        >>> fb = FancyBeams()
+        >>> fb.style = 'fancy'
+        >>> copy.deepcopy(fb).style
+        'fancy'
+        '''
+        if type(self) is not Beams:
+            return common.defaultDeepcopy(self, memo)
+        new = Beams.__new__(Beams)
+        new.beamsList = copy.deepcopy(self.beamsList, memo) if self.beamsList else []
+        new.feathered = self.feathered
+        new.id = self.id
+        return new
+
     def __iter__(self):
         return iter(self.beamsList)
 
@@ -704,6 +741,21 @@ class Test(unittest.TestCase):
         from music21.test.commonTest import testCopyAll
         testCopyAll(self, globals())
 
+    def testDeepcopySubclassKeepsAttributes(self):
+        class AnnotatedBeams(Beams):
+            pass
+
+        b = AnnotatedBeams()
+        b.fill('eighth', type='start')
+        b.id = 'b1'
+        b.extra = True
+        c = copy.deepcopy(b)
+        self.assertIsInstance(c, AnnotatedBeams)
+        self.assertTrue(c.extra)
+        self.assertEqual(c.id, 'b1')
+        self.assertEqual(c, b)
+        self.assertIsNot(c.beamsList[0], b.beamsList[0])
+
 
 # -----------------------------------------------------------------------------
 # define presented order in documentation
@@ -145,7 +145,10 @@ class SingletonCounter:
         _singletonCounter['value'] += 1
         return post
 
+
 # ------------------------------------------------------------------------------
+# cache of class -> all slot names found on its mro, see _getSlotsRecursive()
+_slotsByClass: dict[type, frozenset[str]] = {}
 
 
 class SlottedObjectMixin:
@@ -238,10 +241,18 @@ class SlottedObjectMixin:
         ['_editorial', '_style', 'direction', 'funkiness', 'groovability',
             'id', 'independentAngle', 'number', 'type']
         '''
+        # this is called on every copy and pickle, so cache it per class
+        thisClass = self.__class__
+        try:
+            return _slotsByClass[thisClass]
+        except KeyError:
+            pass
         slots = set()
-        for cls in self.__class__.mro():
+        for cls in thisClass.mro():
             slots.update(getattr(cls, '__slots__', ()))
-        return slots
+        frozenSlots = frozenset(slots)
+        _slotsByClass[thisClass] = frozenSlots
+        return frozenSlots
 
 
 class EqualSlottedObjectMixin(SlottedObjectMixin):
@@ -1833,7 +1833,9 @@ class Duration(prebase.ProtoM21Object, SlottedObjectMixin):
             qlc = quarterConversion(self._qtrLength)
             self.components = tuple(qlc.components)
             if qlc.tuplet is not None:
-                self.tuplets = (copy.deepcopy(qlc.tuplet),)
+                # the cached Tuplet holds only immutable values (ints, strings,
+                # DurationTuples), so a shallow copy is enough and much cheaper.
+                self.tuplets = (copy.copy(qlc.tuplet),)
         self._componentsNeedUpdating = False
 
     # PUBLIC METHODS #
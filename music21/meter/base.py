@@ -1431,6 +1431,7 @@ class TimeSignature(TimeSignatureBase):
 
         beamsList = beam.Beams.naiveBeams(srcList)  # hold maximum Beams objects, all with type None
         beamsList = beam.Beams.removeSandwichedUnbeamables(beamsList)
+        archetypesByDepth: dict[int, MeterSequence] = {}
 
         def fixBeamsOneElementDepth(i: int, el: base.Music21Object, depth: int):
             '''
@@ -1464,8 +1465,12 @@ class TimeSignature(TimeSignatureBase):
             beamPrevious = beamsList[i - 1] if not isFirst else None
 
             # get an archetype of the MeterSequence for this level.
-            # level is the depth, starting at zero
-            archetype = self.beamSequence.getLevel(depth)
+            # level is the depth, starting at zero; it is the same for
+            # every element, so build it once per depth.
+            archetype = archetypesByDepth.get(depth)
+            if archetype is None:
+                archetype = self.beamSequence.getLevel(depth)
+                archetypesByDepth[depth] = archetype
             # span is the quarter note duration points for each partition
             # at this level
             archetypeSpanStart, archetypeSpanEnd = archetype.offsetToSpan(start)
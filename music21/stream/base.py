@@ -21,6 +21,7 @@ and :class:`~music21.stream.Score` objects, are also in this module.
 '''
 from __future__ import annotations
 
+import bisect
 from collections import deque, namedtuple, OrderedDict
 from collections.abc import Collection, Iterable, Sequence
 import copy
@@ -1148,6 +1149,8 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         {0.0} <music21.clef.BassClef>
         {0.0} <music21.note.Note D#>
         '''
+        if not self._hasElementOfClass(clef.Clef):
+            return None
         clefList = self.getElementsByClass(clef.Clef).getElementsByOffset(0)
         # casting to list added 20microseconds
         return clefList.first()
@@ -1210,6 +1213,8 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         >>> p.timeSignature is None
         True
         '''
+        if not self._hasElementOfClass(meter.TimeSignature):
+            return None
         # there could be more than one
         tsList = self.getElementsByClass(meter.TimeSignature).getElementsByOffset(0)
         # environLocal.printDebug([
@@ -1261,6 +1266,8 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         >>> a.keySignature is None
         True
         '''
+        if not self._hasElementOfClass(key.KeySignature):
+            return None
         try:
             return next(self.iter().getElementsByClass(key.KeySignature).getElementsByOffset(0))
         except StopIteration:
@@ -2025,7 +2032,10 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             # noinspection PyArgumentList
             new.coreStoreAtEnd(copy.deepcopy(e, memo))
 
-        new.coreElementsChanged()
+        # elements were added in the same order, so a sorted original
+        # gives a sorted copy; do not force a re-sort on first access.
+        new.coreElementsChanged(clearIsSorted=False)
+        new.isSorted = self.isSorted
 
         return new
 
@@ -2127,6 +2137,29 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         # might change sorting, but not flatness.  Maybe other things can be False too.
         self.coreElementsChanged(updateIsFlat=False)
 
+    def _sortedElementOffsets(self) -> list[OffsetQL]:
+        '''
+        Return a list of the offsets of the elements in `._elements` (not
+        `._endElements`) in order, for binary searches by offset.  The
+        list is cached until the elements change.
+
+        Only sorted Streams give a sorted list, so callers should check
+        `.isSorted` first.
+
+        >>> s = stream.Stream()
+        >>> s.insert(4, note.Note())
+        >>> s.insert(1, note.Note())
+        >>> s.storeAtEnd(bar.Barline())
+        >>> s.sort()
+        >>> s._sortedElementOffsets()
+        [1.0, 4.0]
+        '''
+        if 'sortedElementOffsets' not in self._cache:
+            self._cache['sortedElementOffsets'] = [
+                self.elementOffset(e) for e in self._elements
+            ]
+        return self._cache['sortedElementOffsets']
+
     def elementOffset(self, element, returnSpecial=False):
         '''
         Return the offset as an opFrac (float or Fraction) from the offsetMap.
@@ -2323,6 +2356,9 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         self.coreGuardBeforeAddElement(element)
         # main insert procedure here
 
+        # a single insert can only raise highestTime, so update rather than
+        # discard a cached value
+        highestTime = self._cache.get('HighestTime')
         storeSorted = self.coreInsert(offset,
                                       element,
                                       ignoreSort=ignoreSort,
@@ -2333,6 +2369,9 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         self.coreElementsChanged(updateIsFlat=updateIsFlat)
         if ignoreSort is False:
             self.isSorted = storeSorted
+        if highestTime is not None:
+            self._setHighestTime(max(highestTime,
+                                     opFrac(offset + element.duration.quarterLength)))
 
     def insertIntoNoteOrChord(self, offset, noteOrChord, chordsOnly=False):
         # noinspection PyShadowingNames
@@ -3013,13 +3052,16 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                                         recurse=recurse,
                                         allDerived=False)
 
-        try:
-            i = self.index(replacement)
-        except StreamException:
-            # good. now continue.
-            pass
-        else:
-            raise StreamException(f'{replacement} already in {self}')
+        # every element has an entry in _offsetDict, so only scan with
+        # .index() if the replacement might already be here.
+        if id(replacement) in self._offsetDict:
+            try:
+                i = self.index(replacement)
+            except StreamException:
+                # good. now continue.
+                pass
+            else:
+                raise StreamException(f'{replacement} already in {self}')
 
         try:
             i = self.index(target)
@@ -3034,12 +3076,20 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             return  # do nothing if no match
 
         eLen = len(self._elements)
+        storeSorted = False
         if i < eLen:
             target = self._elements[i]  # target may have been obj id; re-classing
             self._elements[i] = replacement
             # place the replacement at the old objects offset for this site
             self.coreSetElementOffset(replacement, self.elementOffset(target), addElement=True)
             replacement.sites.add(self)
+            # if the replacement sorts between its neighbors, no need to re-sort
+            if self.isSorted:
+                newSortTuple = replacement.sortTuple(self)
+                storeSorted = (
+                    (i == 0 or self._elements[i - 1].sortTuple(self) <= newSortTuple)
+                    and (i == eLen - 1 or newSortTuple <= self._elements[i + 1].sortTuple(self))
+                )
         else:
             # target may have been obj id; reassign
             target = self._endElements[i - eLen]
@@ -3057,8 +3107,16 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         updateIsFlat = False
         if replacement.isStream:
             updateIsFlat = True
+        # all other elements keep their index, so update the index cache
+        # rather than rebuilding it.
+        indexCache = self._cache.get('index')
+        if indexCache is not None:
+            indexCache.pop(id(target), None)
+            indexCache[id(replacement)] = i
         # elements have changed: sort order may change b/c have diff classes
-        self.coreElementsChanged(updateIsFlat=updateIsFlat)
+        self.coreElementsChanged(updateIsFlat=updateIsFlat,
+                                 clearIsSorted=not storeSorted,
+                                 keepIndex=True)
 
         replaceDerived()
 
@@ -4121,28 +4179,53 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         '''
         # NOTE: this is a performance critical method
 
-        # TODO: switch to trees if more than a certain number of elements.
         # TODO: allow sortTuple as a parameter (in all getElementBy/At routines)
 
         candidates = []
         offset: OffsetQL = opFrac(offset)
         nearestTrailSpan = offset  # start with max time
 
-        sIterator = self.iter()
-        if classList:
-            sIterator = sIterator.getElementsByClass(classList)
-        sIterator.restoreActiveSites = False  # do not change other elements + speed.
+        if self.autoSort and not self.isSorted:
+            self.sort()
 
-        # need both _elements and _endElements
-        for e in sIterator:
+        if self.isSorted:
+            # binary search for the last element at or before offset, then look
+            # back only as far as the elements at the nearest offset.
+            elementOffsets = self._sortedElementOffsets()
+            if _beforeNotAt:
+                i = bisect.bisect_left(elementOffsets, offset)
+            else:
+                i = bisect.bisect_right(elementOffsets, offset)
+            classFilter = filters.ClassFilter(classList) if classList else None
+            nearestOffset = None
+            for i in range(i - 1, -1, -1):
+                eOffset = elementOffsets[i]
+                if eOffset < 0 or (nearestOffset is not None and eOffset != nearestOffset):
+                    break
+                e = self._elements[i]
+                if classFilter is not None and not classFilter(e):
+                    continue
+                nearestOffset = eOffset
+                nearestTrailSpan = opFrac(offset - eOffset)
+                candidates.append((nearestTrailSpan, e))
+            # elements stored at end are at highestTime, not in elementOffsets
+            endIterator = self._endElements
+        else:
+            endIterator = self.iter()
+            if classList:
+                endIterator = endIterator.getElementsByClass(classList)
+            endIterator.restoreActiveSites = False  # do not change other elements + speed.
+            classFilter = None
+
+        # for unsorted Streams, this checks all _elements and _endElements
+        for e in endIterator:
+            if classFilter is not None and not classFilter(e):
+                continue
             span: OffsetQL = opFrac(offset - self.elementOffset(e))
             # environLocal.printDebug(['e span check', span, 'offset', offset,
             #   'e.offset', e.offset, 'self.elementOffset(e)', self.elementOffset(e), 'e', e])
             if span < 0 or (span == 0 and _beforeNotAt):
-                if self.isSorted:
-                    break
-                else:
-                    continue
+                continue
             elif span == nearestTrailSpan:
                 candidates.append((span, e))
             elif span < nearestTrailSpan:
@@ -4303,7 +4386,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                 return e
         else:
             for i in range(elPos + 1, len(elements)):
-                if classList is None or classSet.intersection(elements[i].classSet):
+                if not classSet.isdisjoint(elements[i].classSet):
                     e = elements[i]
                     self.coreSelfActiveSite(e)
                     return e
@@ -5950,17 +6033,20 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         '''
         # only want _elements, do not want _endElements
         for e in self._elements:
-
-            if startOffset is not None and self.elementOffset(e) < startOffset:
+            eOffset = self.elementOffset(e)
+            if startOffset is not None and eOffset < startOffset:
                 continue
-            if endOffset is not None and self.elementOffset(e) >= endOffset:
+            if endOffset is not None and eOffset >= endOffset:
                 continue
             if classFilterList is not None and e.classSet.isdisjoint(classFilterList):
                 continue
 
-            self.coreSetElementOffset(e, opFrac(self.elementOffset(e) + offset))
+            # coreSetElementOffset runs opFrac on the new offset
+            self.coreSetElementOffset(e, eOffset + offset)
 
-        self.coreElementsChanged()
+        # shifting every element by the same amount keeps their order
+        shiftedAll = startOffset is None and endOffset is None and classFilterList is None
+        self.coreElementsChanged(clearIsSorted=not shiftedAll)
 
     def transferOffsetToElements(self):
         '''
@@ -6024,8 +6110,8 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         # else:
         #     element = item
 
-        for unused_i in range(numberOfTimes):
-            self.append(copy.deepcopy(element))
+        # append all copies at once so that coreElementsChanged runs only once
+        self.append([copy.deepcopy(element) for unused_i in range(numberOfTimes)])
 
     def repeatInsert(self, item, offsets):
         '''
@@ -6400,8 +6486,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                 return
             totalDuration = sum(r.duration.quarterLength for r in consecutiveRests)
             startOffset = templateInner.elementOffset(consecutiveRests[0])
-            for r in consecutiveRests:
-                templateInner.remove(r)
+            templateInner.remove(consecutiveRests)
             rNew = note.Rest()
             rNew.duration.quarterLength = totalDuration
             templateInner.insert(startOffset, rNew)
@@ -6799,13 +6884,14 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         last_measure: Measure|None = None
 
         for e in noteIterator:
-            if e.activeSite is not None and e.activeSite.isMeasure:
-                if last_measure is not None and e.activeSite is not last_measure:
+            eSite = e.activeSite
+            if eSite is not None and eSite.isMeasure:
+                if last_measure is not None and eSite is not last_measure:
                     # New measure encountered: move pitchPast to
                     # pitchPastMeasure and clear pitchPast
                     pitchPastMeasure = pitchPast[:]
                     pitchPast = []
-                last_measure = e.activeSite
+                last_measure = eSite
             if isinstance(e, note.Note):
                 if e.pitch.nameWithOctave in tiePitchSet:
                     lastNoteWasTied = True
@@ -6842,6 +6928,8 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                 # when reading a chord, this will apply an accidental
                 # if pitches in the chord suggest an accidental
                 seenPitchNames = set()
+                # .pitches builds a new tuple on each call
+                chordPitches = e.pitches
 
                 for n in list(e):
                     p = n.pitch
@@ -6850,7 +6938,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                     else:
                         lastNoteWasTied = False
 
-                    otherSimultaneousPitches = [other for other in e.pitches if other is not p]
+                    otherSimultaneousPitches = [other for other in chordPitches if other is not p]
 
                     p.updateAccidentalDisplay(
                         pitchPast=pitchPast,
@@ -6881,7 +6969,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                 for pName in seenPitchNames:
                     tiePitchSet.add(pName)
 
-                pitchPast += e.pitches
+                pitchPast += chordPitches
 
                 # handle this chord's ornaments' ornamentalPitches
                 makeNotation.makeOrnamentalAccidentals(
@@ -7991,11 +8079,13 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             ignoreSorting=True,
         )
 
+        # sorted below, so do not check sortedness on each insert
         for e in ri:
             if e.isStream and not retainContainers:
                 continue
             sNew.coreInsert(ri.currentHierarchyOffset(),
                              e,
+                             ignoreSort=True,
                              setActiveSite=False)
         if not retainContainers:
             sNew.isFlat = True
@@ -8736,7 +8826,9 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         totalSeconds = 0.0
         activeStart = oStart
         activeEnd = None
-        for s, e, mm in mmBoundaries:
+        # regions are contiguous, so skip straight to the one that can hold oStart
+        first = bisect.bisect_right(mmBoundaries, oStart, key=lambda b: b[0]) - 1
+        for s, e, mm in itertools.islice(mmBoundaries, max(first, 0), None):
             if s <= activeStart < e:
                 # find time in this region
                 if oEnd < e:  # if end within this region
@@ -9612,31 +9704,35 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         else:  # get elements list from Stream
             eToProcess = returnObj.notesAndRests
 
+        qlListSum = opFrac(sum(quarterLengthList))
         for e in eToProcess:
             # if qlList values are greater than the found duration, skip
-            if opFrac(sum(quarterLengthList)) > e.quarterLength:
+            if qlListSum > e.quarterLength:
                 continue
-            elif not opFrac(sum(quarterLengthList)) == e.quarterLength:
-                # try to map a list that is of sufficient duration
+            elif qlListSum != e.quarterLength:
+                # try to map a list that is of sufficient duration;
+                # keep a running total rather than re-summing each time
                 qlProcess = []
+                sumQL = 0.0
                 i = 0
                 while True:
-                    qlProcess.append(
-                        quarterLengthList[i % len(quarterLengthList)])
+                    ql = quarterLengthList[i % len(quarterLengthList)]
+                    qlProcess.append(ql)
                     i += 1
-                    sumQL = opFrac(sum(qlProcess))
+                    sumQL = opFrac(sumQL + ql)
                     if sumQL >= e.quarterLength:
                         break
             else:
                 qlProcess = quarterLengthList
+                sumQL = qlListSum
 
             # environLocal.printDebug(['got qlProcess', qlProcess,
             # 'for element', e, e.quarterLength])
 
-            if not opFrac(sum(qlProcess)) == e.quarterLength:
+            if sumQL != e.quarterLength:
                 raise StreamException(
                     'cannot map quarterLength list into element Duration: %s, %s' % (
-                        sum(qlProcess), e.quarterLength))
+                        sumQL, e.quarterLength))
 
             post = e.splitByQuarterLengths(qlProcess, addTies=addTies)
             # remove e from the source
@@ -9865,6 +9961,35 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             self._cache['hasMeasures'] = post
         return self._cache['hasMeasures']
 
+    def _hasElementOfClass(self, classFilter: type) -> bool:
+        '''
+        Return True if any element of this Stream, including elements stored
+        at the end, is an instance of `classFilter`.
+
+        The set of element types is cached, so properties such as `.clef` and
+        `.timeSignature` can return quickly on Measures that have none.
+
+        >>> m = stream.Measure()
+        >>> m.append(note.Note())
+        >>> m._hasElementOfClass(clef.Clef)
+        False
+        >>> m.storeAtEnd(clef.BassClef())
+        >>> m._hasElementOfClass(clef.Clef)
+        True
+        >>> m._hasElementOfClass(note.GeneralNote)
+        True
+        '''
+        # a search through .iter() sorts an autoSort Stream, and code such as
+        # the braille translator depends on getters like .clef doing so.
+        if self.autoSort and not self.isSorted:
+            self.sort()
+        if 'elementTypes' not in self._cache or self._cache['elementTypes'] is None:
+            elementTypes = {type(e) for e in self._elements}
+            elementTypes.update(type(e) for e in self._endElements)
+            self._cache['elementTypes'] = elementTypes
+        return any(issubclass(elType, classFilter)
+                   for elType in self._cache['elementTypes'])
+
     def hasVoices(self):
         '''
         Return a boolean value showing if this Stream contains Voices
@@ -10191,14 +10316,14 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         [<music21.pitch.Pitch F#4>, <music21.pitch.Pitch C4>,
          <music21.pitch.Pitch E4>, <music21.pitch.Pitch G4>]
         '''
-        post = []
+        post: list[pitch.Pitch] = []
         for e in self.elements:
             if isinstance(e, key.Key):
                 continue  # has .pitches but should not be added
             # both GeneralNotes and Stream have a pitches properties; this just
             # causes a recursive pitch gathering
             elif isinstance(e, (note.GeneralNote, Stream)):
-                post.extend(list(e.pitches))
+                post.extend(e.pitches)
         return post
 
     # --------------------------------------------------------------------------
@@ -11588,7 +11713,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
 
         * Changed in v5: inPlace is default False and a keyword only arg.
         '''
-        if not self.voices:
+        if not self.hasVoices():
             return None  # do not make copy; return immediately
 
         if not inPlace:  # make a copy
@@ -11605,17 +11730,17 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             else:
                 flatten.append(v)
 
-        for v in remove:
-            returnObj.remove(v)
+        if remove:
+            returnObj.remove(remove)
 
         if len(flatten) == 1 or force:  # always flatten 1
             for v in flatten:  # usually one unless force
                 # get offset of voice in returnObj
-                shiftOffset = v.getOffsetBySite(returnObj)
+                shiftOffset = returnObj.elementOffset(v)
                 for e in v.elements:
                     # insert shift + offset w/ voice
-                    returnObj.coreInsert(shiftOffset + e.getOffsetBySite(v), e)
-                returnObj.remove(v)
+                    returnObj.coreInsert(shiftOffset + v.elementOffset(e), e)
+            returnObj.remove(flatten)
             returnObj.coreElementsChanged()
 
         if not inPlace:
@@ -12130,26 +12255,54 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         # this method matches and removes on an individual basis
         if not matchBySpan:
             targetsMatched = 0
-            for e in v.elements:  # get components in the Variant
-                # get target offset relative to Stream
-                oInStream = vStart + e.getOffsetBySite(v.containedSite)
-                # get all elements at this offset, force a class match
-                targets = self.getElementsByOffset(oInStream).getElementsByClass(e.classes[0])
+            components = v.elements  # get components in the Variant
+            # get target offsets relative to Stream
+            componentOffsets = [opFrac(vStart + e.getOffsetBySite(v.containedSite))
+                                for e in components]
+            # Every remove below would re-sort self after the previous insert, and
+            # every offset search would scan it.  If no two components share an
+            # offset, no component can replace one swapped in before it, so find
+            # all targets from one offset index and swap them in two batches.
+            elementsByOffset: dict[OffsetQL, list[base.Music21Object]]|None = None
+            if len(set(componentOffsets)) == len(componentOffsets):
+                elementsByOffset = {}
+                for el in self:
+                    elementsByOffset.setdefault(self.elementOffset(el), []).append(el)
+            replacedTargets = []
+            replacements = []  # (offset, component) pairs
+            for e, oInStream in zip(components, componentOffsets):
+                # get the first element at this offset, force a class match
+                className = e.classes[0]
+                if elementsByOffset is None:
+                    targetToReplace = self.getElementsByOffset(
+                        oInStream).getElementsByClass(className).first()
+                else:
+                    targetToReplace = next((el for el in elementsByOffset.get(oInStream, ())
+                                            if className in el.classSet), None)
                 # only replace if we match the start
-                if targets:
+                if targetToReplace is not None:
                     targetsMatched += 1
                     # always assume we just want the first one?
-                    targetToReplace = targets[0]
                     # environLocal.printDebug(['matchBySpan', matchBySpan,
                     #     'found target to replace:', targetToReplace])
                     # remove the target, place in removed Variant
                     removed.append(targetToReplace)
-                    self.remove(targetToReplace)
-                    # extract the variant component and insert into place
-                    self.insert(oInStream, e)
+                    if elementsByOffset is None:
+                        self.remove(targetToReplace)
+                        # extract the variant component and insert into place
+                        self.insert(oInStream, e)
+                    else:
+                        replacedTargets.append(targetToReplace)
+                        replacements.append((oInStream, e))
 
                     if getattr(targetToReplace, 'isMeasure', False):
                         e.number = targetToReplace.number
+            if replacedTargets:
+                self.remove(replacedTargets)
+                for oInStream, e in replacements:
+                    self.coreGuardBeforeAddElement(e)
+                    self.coreInsert(oInStream, e)
+                self.coreElementsChanged()
             # only remove old and add removed if we matched
             if targetsMatched > 0:
                 # remove the original variant
@@ -13363,12 +13516,26 @@ class Measure(Stream):
         'Dotted Half'
         >>> m.duration.fullName
         'Whole tied to Quarter (5 total QL)'
+
+        A TimeSignature found in the Measure itself is cached, but replacing
+        it clears the cache:
+
+        >>> m.timeSignature = meter.TimeSignature('6/8')
+        >>> m.barDuration
+        <music21.duration.Duration 3.0>
+        >>> m.timeSignature = meter.TimeSignature('2/4')
+        >>> m.barDuration
+        <music21.duration.Duration 2.0>
         '''
-        # TODO: it is possible that this should be cached or exposed as a method
-        #     as this search may take some time.
-        if self.timeSignature is not None:
+        # only a TimeSignature in this Measure is cached: any change to the
+        # elements clears the cache, but a context-based search may give a
+        # different answer without this Measure being notified.
+        ts = self._cache.get('barDurationTimeSignature')
+        if ts is None:
             ts = self.timeSignature
-        else:  # do a context-based search
+            if ts is not None:
+                self._cache['barDurationTimeSignature'] = ts
+        if ts is None:  # do a context-based search
             tsStream = self.getTimeSignatures(searchContext=True,
                                               returnDefault=False,
                                               sortByCreationTime=True)
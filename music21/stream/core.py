@@ -105,15 +105,19 @@ class StreamCore(Music21Object):
             # # are still inserted
             # if self.isSorted is True and self.highestTime <= offset:
             #     storeSorted = True
+            # in a sorted Stream the last element has the highest offset, so
+            # compare against its offset, not highestTime, which would reject
+            # in-order insertions that overlap the previous element's duration.
             if self.isSorted is True:
-                ht = self.highestTime   # type: ignore
-                if ht < offset:
+                if not self._elements:
                     storeSorted = True
-                elif ht == offset:
-                    if not self._elements:
+                else:
+                    lastElement = self._elements[-1]
+                    lastOffset = self.elementOffset(lastElement)  # type: ignore
+                    if lastOffset < offset:
                         storeSorted = True
-                    else:
-                        highestSortTuple = self._elements[-1].sortTuple()
+                    elif lastOffset == offset:
+                        highestSortTuple = lastElement.sortTuple(self)  # type: ignore
                         thisSortTuple = element.sortTuple().modify(offset=offset)
 
                         if highestSortTuple < thisSortTuple:
@@ -255,6 +255,9 @@ class ClassFilter(StreamFilter):
             classList = (classList,)
 
         self.classList = classList
+        # classSet depends only on the class of an item, so the answer
+        # for each class can be remembered for the life of the filter.
+        self._matchByClass: dict[type, bool] = {}
 
     def __eq__(self, other):
         if other.__class__ is not self.__class__:
@@ -264,7 +267,13 @@ class ClassFilter(StreamFilter):
         return True
 
     def __call__(self, item, iterator=None):
-        return not item.classSet.isdisjoint(self.classList)
+        itemClass = item.__class__
+        try:
+            return self._matchByClass[itemClass]
+        except KeyError:
+            match = not item.classSet.isdisjoint(self.classList)
+            self._matchByClass[itemClass] = match
+            return match
 
     def _reprInternal(self):
         if len(self.classList) == 1:
@@ -294,7 +303,7 @@ class ClassNotFilter(ClassFilter):
     derivationStr = 'getElementsNotOfClass'
 
     def __call__(self, item, iterator=None):
-        return item.classSet.isdisjoint(self.classList)
+        return not super().__call__(item, iterator)
 
 
 class GroupFilter(StreamFilter):
@@ -16,6 +16,7 @@ StreamIterators are explicitly allowed to access private methods on streams.
 '''
 from __future__ import annotations
 
+import bisect
 from collections.abc import Callable, Iterable, Sequence
 import copy
 import typing as t
@@ -142,6 +143,10 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
 
         # use .elements instead of ._elements/etc. so that it is sorted
         self.srcStreamElements = t.cast(tuple[M21ObjType, ...], srcStream.elements)
+        # the cached list that srcStreamElements was made from; the Stream
+        # drops it whenever its elements change.  See _startIndex().
+        # noinspection PyProtectedMember
+        self._srcStreamElementsCache = srcStream._cache.get('elements')
         self.streamLength: int = len(self.srcStreamElements)
 
         # this information can help in speed later
@@ -632,7 +637,7 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
         '''
         reset prior to iteration
         '''
-        self.elementIndex = 0
+        self.elementIndex = self._startIndex()
         self.iterSection = '_elements'
         self.updateActiveInformation()
         self.activeInformation['lastYielded'] = None
@@ -640,6 +645,53 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
             if isinstance(f, filters.StreamFilter):
                 f.reset()
 
+    def _startIndex(self) -> int:
+        '''
+        Return the index of the first element that could pass the filters.
+
+        Elements of a sorted Stream are in offset order, so if an OffsetFilter
+        requires elements to begin within its span, everything before
+        `offsetStart` can be skipped with a binary search rather than
+        being tested one at a time.  Otherwise, returns 0.
+
+        Offsets may have changed since the iterator was created, so the
+        binary search is only used if the Stream is still sorted and its
+        cached elements are still the ones being iterated.  Both are cleared
+        together by `coreElementsChanged`, so this check does not need to
+        look at the elements themselves.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 8)
+        >>> sIter = s.iter().getElementsByOffset(5, 6)
+        >>> sIter._startIndex()
+        5
+        >>> [s.elementOffset(n) for n in sIter]
+        [5.0, 6.0]
+        >>> s.iter()._startIndex()
+        0
+
+        Moving an element out of order means the search cannot be used:
+
+        >>> s.setElementOffset(s.first(), 5.5)
+        >>> sIter._startIndex()
+        0
+        '''
+        offsetStart = None
+        for f in self.filters:
+            if isinstance(f, filters.OffsetFilter) and f.mustBeginInSpan:
+                if offsetStart is None or f.offsetStart > offsetStart:
+                    offsetStart = f.offsetStart
+        if offsetStart is None:
+            return 0
+        srcStream = self.srcStream
+        # noinspection PyProtectedMember
+        if (not srcStream.isSorted
+                or self._srcStreamElementsCache is None
+                or srcStream._cache.get('elements') is not self._srcStreamElementsCache):
+            return 0
+        # noinspection PyProtectedMember
+        return bisect.bisect_left(srcStream._sortedElementOffsets(), offsetStart)
+
     def resetCaches(self) -> None:
         '''
         reset any cached data. -- do not use this at
@@ -1893,6 +1945,11 @@ class RecursiveIterator(StreamIterator[M21ObjType], Sequence[M21ObjType]):
         self.cleanup()
         raise StopIteration
 
+    def _startIndex(self) -> int:
+        # filters are also applied within each substream,
+        # so no element of this Stream can be skipped in advance.
+        return 0
+
     def reset(self):
         '''
         reset prior to iteration
@@ -2195,6 +2252,25 @@ class Test(unittest.TestCase):
         child = sIter.childRecursiveIterator
         self.assertIsInstance(child, ImportedRecursiveIterator)
 
+    def testOffsetIteratorReusedAfterOffsetChange(self):
+        from music21 import stream
+        s = stream.Stream()
+        notes = [note.Note() for _ in range(8)]
+        for i, n in enumerate(notes):
+            s.insert(i, n)
+        sIter = s.iter().getElementsByOffset(4, 6)
+        self.assertEqual([s.elementOffset(n) for n in sIter], [4.0, 5.0, 6.0])
+
+        # the iterator still holds the elements in their old order
+        s.setElementOffset(notes[0], 5)
+        self.assertEqual([s.elementOffset(n) for n in sIter], [5.0, 4.0, 5.0, 6.0])
+
+        # re-sorting does not reorder what the iterator already holds
+        s.sort()
+        self.assertEqual([s.elementOffset(n) for n in sIter], [5.0, 4.0, 5.0, 6.0])
+        self.assertEqual([s.elementOffset(n) for n in s.iter().getElementsByOffset(4, 6)],
+                         [4.0, 5.0, 5.0, 6.0])
+
 
 
 
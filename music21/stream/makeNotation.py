@@ -1249,6 +1249,8 @@ def makeTies(
         # get the current measure to look for notes that need ties
         m = measureList[mCount]
         activeTS = meterStream.getElementAtOrBefore(m.offset)
+        # computing barDuration creates a new Duration; do it once per measure
+        mEnd = activeTS.barDuration.quarterLength
 
         # get next measure; we may not need it, but have it ready
         if mCount + 1 < len(measureList):
@@ -1258,23 +1260,20 @@ def makeTies(
             mNext = stream.Measure()
             # set offset to last offset plus total length
             mOffset = m.offset
-            mNext.offset = (mOffset
-                            + activeTS.barDuration.quarterLength)
+            mNext.offset = mOffset + mEnd
             # increment measure number
             mNext.number = m.number + 1
             mNextAdd = True  # new measure, needs to be appended
 
-        if mNext.hasVoices():
-            mNextHasVoices = True
-        else:
-            mNextHasVoices = False
+        # most measures need no splits, so only look for voices in mNext
+        # once the first element crossing the barline is found
+        mNextHasVoices = None
 
         # environLocal.printDebug([
         #    'makeTies() dealing with measure', m, 'mNextAdd', mNextAdd])
         # for each measure, go through each element and see if its
         # duration fits in the bar that contains it
 
-        mEnd = activeTS.barDuration.quarterLength
         # if there are voices, we must look at voice id values to only
         # connect ties to components in the same voice, assuming there
         # are voices in the next measure
@@ -1316,6 +1315,8 @@ def makeTies(
                 )
 
                 # manage bridging voices
+                if mNextHasVoices is None:
+                    mNextHasVoices = mNext.hasVoices()
                 if mNextHasVoices:
                     if mHasVoices:  # try to match voice id
                         if not isinstance(vId, int):
@@ -1391,24 +1392,20 @@ def makeTupletBrackets(s: StreamType, *, inPlace=False) -> StreamType|None:
     * Changed in v1.8: `inPlace` is False by default
     * Changed in v7: Legacy behavior of taking in a list of durations removed.
     '''
-    durationList: list[duration.Duration] = []
-
     # Stream, as it should be
     if not inPlace:  # make a copy
         returnObj = s.coreCopyAsDerivation('makeTupletBrackets')
     else:
         returnObj = s
 
-    # only want to look at notes and rests.
-    for n in returnObj.notesAndRests:
-        if n.duration.isGrace:
-            continue
-        durationList.append(n.duration)
-
     # a list of (tuplet obj, Duration) pairs
     tupletMap: list[tuple[duration.Tuplet|None, duration.Duration]] = []
 
-    for dur in durationList:  # all Duration objects
+    # only want to look at notes and rests.
+    for n in returnObj.notesAndRests:
+        dur = n.duration
+        if dur.isGrace:
+            continue
         tupletList = dur.tuplets
         if not tupletList:  # no tuplets
             tupletMap.append((None, dur))
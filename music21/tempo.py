@@ -814,7 +814,7 @@ class MetronomeMark(TempoIndication):
         '''
         qbpm = self.getQuarterBPM()
         if qbpm is not None:
-            return 60.0 / self.getQuarterBPM()
+            return 60.0 / qbpm
         else:
             raise MetronomeMarkException('cannot derive seconds as getQuarterBPM() returns None')
 
@@ -1132,6 +1132,20 @@ class Test(unittest.TestCase):
         with self.assertWarnsRegex(Warning, msg):
             obj2.id = obj.id
 
+    def testSplitAtQuarterLengthChordNoteDurations(self):
+        '''
+        Both halves of a split Chord treat their notes' durations the same way.
+        '''
+        from music21 import chord
+        for retainOrigin in (True, False):
+            c = chord.Chord(['C4', 'E4'], quarterLength=3.0)
+            left, right = c.splitAtQuarterLength(1.0, retainOrigin=retainOrigin)
+            self.assertEqual(left.quarterLength, 1.0)
+            self.assertEqual(right.quarterLength, 2.0)
+            self.assertEqual([n.quarterLength for n in left.notes], [3.0, 3.0])
+            self.assertEqual([n.quarterLength for n in right.notes], [3.0, 3.0])
+            self.assertIsNot(left.duration, right.duration)
+
 
 # -------------------------------------------
 if __name__ == '__main__':
@@ -779,7 +779,9 @@ class Verticality(prebase.ProtoM21Object):
             '''
             Make a copy of the note and clear some settings
             '''
-            nNew = copy.deepcopy(n)
+            # the duration is replaced by the shared chord duration below,
+            # so seed the memo to avoid deep-copying the original one.
+            nNew = copy.deepcopy(n, {id(n.duration): dur})
             nNew.duration = dur
             if not copyPitches:
                 nNew.pitch = n.pitch